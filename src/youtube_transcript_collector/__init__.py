@@ -3,7 +3,7 @@
 __version__ = "0.1.0"
 
 # Main workflow function
-from .transcript import download_channel_transcripts
+from .transcript import adownload_channel_transcripts, download_channel_transcripts
 
 # API functions for getting channel and video data
 from .api import (
@@ -14,6 +14,7 @@ from .api import (
 
 # Transcript functions
 from .transcript import (
+    cached_download_transcript,
     download_transcript,
     save_transcript,
 )
@@ -24,11 +25,13 @@ from .config import load_config_from_env
 __all__ = [
     # Main workflow
     "download_channel_transcripts",
+    "adownload_channel_transcripts",
     # API functions
     "get_channel_id",
     "get_all_video_ids",
     "get_video_metadata",
     # Transcript functions
+    "cached_download_transcript",
     "download_transcript",
     "save_transcript",
     # Config
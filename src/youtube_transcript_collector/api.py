@@ -1,12 +1,119 @@
 """YouTube Data API functions for retrieving channel and video information."""
 
+import random
+import re
+import threading
 import time
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
 
 import requests
 
+from .cache import cache_channel_lookup
+from .ratelimit import HeaderRateLimiter
+from .session import create_session
 
-def get_channel_id(identifier: str, api_key: str, delay: float = 1.0) -> str:
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+# Timeout in seconds for each API request
+_REQUEST_TIMEOUT = 10
+
+# API calls reuse pooled keep-alive connections. requests.Session isn't
+# thread-safe, so each thread (metadata workers, the pagination prefetcher)
+# gets its own session, the same way transcript downloads get their clients.
+_thread_local = threading.local()
+
+_LIMITER = HeaderRateLimiter()
+
+# 403 error reasons that mean "slow down" rather than "not allowed". The daily
+# quotaExceeded reason is left out, since retrying can't succeed until reset.
+_RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+_MAX_RATE_LIMIT_RETRIES = 5
+
+_YOUTUBE_HOSTS = ("youtube.com", "youtu.be")
+
+# Matches channel URL paths: /channel/<id>, /c/<name>, /user/<name> and /@<handle>
+_CHANNEL_PATH_RE = re.compile(r"/(?:(channel|c|user)/|@)([^/]+)")
+
+
+def _get_session() -> requests.Session:
+    """Return the API session for the current thread."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = _thread_local.session = create_session()
+        session.headers.update({"User-Agent": "youtube-transcript-collector"})
+    return session
+
+
+def _is_rate_limited(response: requests.Response) -> bool:
+    """Return True if a response is a 403 caused by per-second rate limits."""
+    if response.status_code != 403:
+        return False
+    try:
+        errors = _parse_json(response)["error"]["errors"]
+        return any(error.get("reason") in _RATE_LIMIT_REASONS for error in errors)
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return False
+
+
+def _api_get(url: str, params: Dict, delay: float = 0.0) -> requests.Response:
+    """
+    Send a GET request to the YouTube Data API, paced by the shared rate limiter.
+
+    429 and 5xx responses are retried by the session. 403 rate-limit errors
+    are retried here with exponential backoff and jitter.
+
+    Args:
+        url: The API endpoint URL
+        params: Query parameters for the request
+        delay: Minimum delay in seconds between requests to the API host
+
+    Returns:
+        The successful response
+
+    Raises:
+        requests.RequestException: If the API request fails
+    """
+    host = urlsplit(url).netloc
+
+    for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+        _LIMITER.acquire(host, delay)
+        response = _get_session().get(url, params=params, timeout=_REQUEST_TIMEOUT)
+        _LIMITER.update(host, response)
+
+        if attempt == _MAX_RATE_LIMIT_RETRIES or not _is_rate_limited(response):
+            break
+
+        # Jitter keeps concurrent workers from retrying in lockstep
+        time.sleep(min(60, 2**attempt) + random.uniform(0, 1))
+
+    response.raise_for_status()
+    return response
+
+
+def _parse_json(response: requests.Response) -> Dict:
+    """Parse a JSON response body, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _is_youtube_host(hostname: Optional[str]) -> bool:
+    """Return True for youtube.com, youtu.be and their subdomains."""
+    if not hostname:
+        return False
+    return any(
+        hostname == host or hostname.endswith(f".{host}") for host in _YOUTUBE_HOSTS
+    )
+
+
+@cache_channel_lookup
+def get_channel_id(identifier: str, api_key: str, delay: float = 0.0) -> str:
     """
     Get channel ID from various identifier types (username, handle, URL, or channel ID).
 
@@ -18,7 +125,8 @@ def get_channel_id(identifier: str, api_key: str, delay: float = 1.0) -> str:
             - Channel URL (e.g., "https://www.youtube.com/channel/UC...")
             - Channel custom URL (e.g., "https://www.youtube.com/c/channelname")
         api_key: YouTube Data API v3 key
-        delay: Delay in seconds after the request (default: 1.0)
+        delay: Minimum delay in seconds between API requests (default: 0.0).
+               Rate-limit headers sent by the API are always honored.
 
     Returns:
         The channel ID (e.g., "UC-lHJZR3Gqxm24_Vd_AJ5Yw")
@@ -27,28 +135,36 @@ def get_channel_id(identifier: str, api_key: str, delay: float = 1.0) -> str:
         ValueError: If the channel cannot be found or identifier is invalid
         requests.RequestException: If the API request fails
     """
+    identifier = identifier.strip()
+
     # If it's already a channel ID (starts with UC), return it
     if identifier.startswith("UC") and len(identifier) == 24:
         return identifier
 
-    # Extract identifier from URL if it's a URL
-    if "youtube.com" in identifier or "youtu.be" in identifier:
-        # Extract channel ID from URL like https://www.youtube.com/channel/UC...
-        if "/channel/" in identifier:
-            channel_id = identifier.split("/channel/")[-1].split("?")[0].split("/")[0]
-            if channel_id.startswith("UC") and len(channel_id) == 24:
-                return channel_id
-
-        # Extract username/handle from custom URL like https://www.youtube.com/c/channelname
-        if "/c/" in identifier:
-            username = identifier.split("/c/")[-1].split("?")[0].split("/")[0]
-            identifier = username
-        elif "/user/" in identifier:
-            username = identifier.split("/user/")[-1].split("?")[0].split("/")[0]
-            identifier = username
-        elif "/@" in identifier:
-            handle = identifier.split("/@")[-1].split("?")[0].split("/")[0]
-            identifier = f"@{handle}"
+    # Extract identifier from URL if it's a URL. Only the path is matched, so
+    # query strings and fragments can't be mistaken for channel names.
+    match = None
+    if any(host in identifier.lower() for host in _YOUTUBE_HOSTS):
+        # urlsplit only finds the host when the URL has a scheme
+        parsed = urlsplit(
+            identifier if "://" in identifier else f"https://{identifier}"
+        )
+        if _is_youtube_host(parsed.hostname):
+            match = _CHANNEL_PATH_RE.match(parsed.path)
+
+    if match:
+        kind, value = match.groups()
+        if kind == "channel":
+            # URL like https://www.youtube.com/channel/UC...
+            if value.startswith("UC") and len(value) == 24:
+                return value
+            identifier = value
+        elif kind is None:
+            # Handle URL like https://www.youtube.com/@channelname
+            identifier = f"@{value}"
+        else:
+            # Custom or user URL like https://www.youtube.com/c/channelname
+            identifier = value
 
     # Remove @ if present (for handles)
     if identifier.startswith("@"):
@@ -67,13 +183,8 @@ def get_channel_id(identifier: str, api_key: str, delay: float = 1.0) -> str:
         # Try username (older format)
         params["forUsername"] = username
 
-    response = requests.get(url, params=params)
-    response.raise_for_status()
-
-    # Add delay to avoid rate limiting
-    time.sleep(delay)
-
-    data = response.json()
+    response = _api_get(url, params, delay)
+    data = _parse_json(response)
 
     if data.get("items") and len(data["items"]) > 0:
         return data["items"][0]["id"]
@@ -82,10 +193,8 @@ def get_channel_id(identifier: str, api_key: str, delay: float = 1.0) -> str:
     if identifier.startswith("@"):
         # Try as username instead
         params = {"part": "id", "key": api_key, "forUsername": handle}
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        time.sleep(delay)
-        data = response.json()
+        response = _api_get(url, params, delay)
+        data = _parse_json(response)
 
         if data.get("items") and len(data["items"]) > 0:
             return data["items"][0]["id"]
@@ -96,8 +205,9 @@ def get_channel_id(identifier: str, api_key: str, delay: float = 1.0) -> str:
     )
 
 
+@cache_channel_lookup
 def get_channel_uploads_playlist_id(
-    channel_id: str, api_key: str, delay: float = 1.0
+    channel_id: str, api_key: str, delay: float = 0.0
 ) -> str:
     """
     Get the uploads playlist ID for a given YouTube channel.
@@ -105,7 +215,8 @@ def get_channel_uploads_playlist_id(
     Args:
         channel_id: The YouTube channel ID
         api_key: YouTube Data API v3 key
-        delay: Delay in seconds after the request (default: 1.0)
+        delay: Minimum delay in seconds between API requests (default: 0.0).
+               Rate-limit headers sent by the API are always honored.
 
     Returns:
         The uploads playlist ID
@@ -117,13 +228,8 @@ def get_channel_uploads_playlist_id(
     url = "https://www.googleapis.com/youtube/v3/channels"
     params = {"part": "contentDetails", "id": channel_id, "key": api_key}
 
-    response = requests.get(url, params=params)
-    response.raise_for_status()
-
-    # Add delay to avoid rate limiting
-    time.sleep(delay)
-
-    data = response.json()
+    response = _api_get(url, params, delay)
+    data = _parse_json(response)
     if not data.get("items"):
         raise ValueError(f"No channel found with ID: {channel_id}")
 
@@ -133,11 +239,68 @@ def get_channel_uploads_playlist_id(
     return uploads_playlist_id
 
 
+def _iter_playlist_pages(
+    playlist_id: str, api_key: str, api_delay: float = 0.0
+) -> Iterator[List[str]]:
+    """
+    Yield the video IDs on each page of a playlist, in playlist order.
+
+    The next page is requested in the background while the caller processes
+    the current one, so the network round trip overlaps with that work. If the
+    caller stops early, at most one extra page is requested.
+
+    Args:
+        playlist_id: The YouTube playlist ID
+        api_key: YouTube Data API v3 key
+        api_delay: Minimum delay in seconds between API requests (default: 0.0)
+
+    Yields:
+        List of video IDs on each page
+    """
+    url = "https://www.googleapis.com/youtube/v3/playlistItems"
+
+    def fetch_page(page_token: Optional[str]) -> Dict:
+        params = {
+            "part": "snippet",
+            "playlistId": playlist_id,
+            "maxResults": 50,  # Maximum allowed per request
+            "key": api_key,
+        }
+
+        if page_token:
+            params["pageToken"] = page_token
+
+        return _parse_json(_api_get(url, params, api_delay))
+
+    # The page token chain is sequential, so one background worker is enough
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        future = executor.submit(fetch_page, None)
+        while future is not None:
+            data = future.result()
+
+            # Start fetching the next page before handing this one over
+            next_page_token = data.get("nextPageToken")
+            future = (
+                executor.submit(fetch_page, next_page_token)
+                if next_page_token
+                else None
+            )
+
+            yield [
+                item["snippet"]["resourceId"]["videoId"]
+                for item in data.get("items", [])
+            ]
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def get_all_video_ids(
     channel_id: str,
     api_key: str,
     max_results: Optional[int] = None,
-    api_delay: float = 1.0,
+    api_delay: float = 0.0,
+    stop_at: Optional[str] = None,
 ) -> List[str]:
     """
     Get all video IDs from a channel, ordered from latest to oldest.
@@ -146,10 +309,13 @@ def get_all_video_ids(
         channel_id: The YouTube channel ID
         api_key: YouTube Data API v3 key
         max_results: Optional maximum number of videos to retrieve. If None, retrieves all.
-        api_delay: Delay in seconds between API requests (default: 1.0)
+        api_delay: Minimum delay in seconds between API requests (default: 0.0).
+                   Rate-limit headers sent by the API are always honored.
+        stop_at: Optional video ID to stop at. Pagination ends as soon as this video
+                 is reached, and it and all older videos are left out.
 
     Returns:
-        List of video IDs ordered from latest to oldest
+        List of unique video IDs ordered from latest to oldest
     """
     # Get the uploads playlist ID
     uploads_playlist_id = get_channel_uploads_playlist_id(
@@ -157,55 +323,82 @@ def get_all_video_ids(
     )
 
     video_ids = []
-    next_page_token = None
-    url = "https://www.googleapis.com/youtube/v3/playlistItems"
+    # The playlist can list a video more than once, e.g. when items shift
+    # between pages while paginating
+    seen = set()
+
+    with closing(
+        _iter_playlist_pages(uploads_playlist_id, api_key, api_delay)
+    ) as pages:
+        for page in pages:
+            for video_id in page:
+                # Everything from here on is already known to the caller
+                if video_id == stop_at:
+                    return video_ids
+
+                if video_id in seen:
+                    continue
+                seen.add(video_id)
+                video_ids.append(video_id)
+
+                # Check if we've reached the max_results limit
+                if max_results and len(video_ids) >= max_results:
+                    return video_ids[:max_results]
 
-    while True:
-        params = {
-            "part": "snippet",
-            "playlistId": uploads_playlist_id,
-            "maxResults": 50,  # Maximum allowed per request
-            "key": api_key,
-        }
-
-        if next_page_token:
-            params["pageToken"] = next_page_token
-
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-
-        # Add delay to avoid rate limiting
-        time.sleep(api_delay)
+    return video_ids
 
-        data = response.json()
 
-        # Extract video IDs from this page
-        for item in data.get("items", []):
-            video_id = item["snippet"]["resourceId"]["videoId"]
-            video_ids.append(video_id)
+def _fetch_metadata_batch(
+    batch: List[str], base_params: Dict[str, str], api_delay: float
+) -> Dict[str, Dict]:
+    """Fetch metadata for a single batch of up to 50 video IDs."""
+    url = "https://www.googleapis.com/youtube/v3/videos"
+    # Batches run concurrently, so each gets its own copy of the shared params.
+    # The API takes one comma-separated "id" value; a repeated id= parameter per
+    # video would only make the URL longer.
+    params = {**base_params, "id": ",".join(batch)}
 
-            # Check if we've reached the max_results limit
-            if max_results and len(video_ids) >= max_results:
-                return video_ids[:max_results]
+    response = _api_get(url, params, api_delay)
+    data = _parse_json(response)
 
-        # Check if there are more pages
-        next_page_token = data.get("nextPageToken")
-        if not next_page_token:
-            break
+    metadata = {}
+    for item in data.get("items", []):
+        # Bind the lookups once per item; parts can be missing, e.g. for
+        # videos with hidden statistics
+        item_get = item.get
+        snippet_get = item_get("snippet", {}).get
+        statistics_get = item_get("statistics", {}).get
+
+        metadata[item["id"]] = {
+            "title": snippet_get("title", "Unknown Title"),
+            "description": snippet_get("description", ""),
+            "publishedAt": snippet_get("publishedAt", ""),
+            "channelTitle": snippet_get("channelTitle", ""),
+            "duration": item_get("contentDetails", {}).get("duration", ""),
+            "viewCount": statistics_get("viewCount", "0"),
+            "likeCount": statistics_get("likeCount", "0"),
+        }
 
-    return video_ids
+    return metadata
 
 
 def get_video_metadata(
-    video_ids: List[str], api_key: str, api_delay: float = 1.0
+    video_ids: List[str],
+    api_key: str,
+    api_delay: float = 0.0,
+    max_workers: int = 5,
 ) -> Dict[str, Dict]:
     """
     Get metadata for a list of video IDs.
 
+    Batches of video IDs are requested concurrently.
+
     Args:
         video_ids: List of YouTube video IDs
         api_key: YouTube Data API v3 key
-        api_delay: Delay in seconds between API requests (default: 1.0)
+        api_delay: Minimum delay in seconds between API requests (default: 0.0).
+                   Rate-limit headers sent by the API are always honored.
+        max_workers: Maximum number of batches requested concurrently (default: 5)
 
     Returns:
         Dictionary mapping video_id to metadata dict with keys:
@@ -221,39 +414,17 @@ def get_video_metadata(
 
     # YouTube API allows up to 50 video IDs per request
     batch_size = 50
-    url = "https://www.googleapis.com/youtube/v3/videos"
-
-    for i in range(0, len(video_ids), batch_size):
-        batch = video_ids[i : i + batch_size]
-
-        params = {
-            "part": "snippet,contentDetails,statistics",
-            "id": ",".join(batch),
-            "key": api_key,
-        }
-
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-
-        # Add delay to avoid rate limiting
-        time.sleep(api_delay)
-
-        data = response.json()
-
-        for item in data.get("items", []):
-            video_id = item["id"]
-            snippet = item.get("snippet", {})
-            content_details = item.get("contentDetails", {})
-            statistics = item.get("statistics", {})
-
-            metadata[video_id] = {
-                "title": snippet.get("title", "Unknown Title"),
-                "description": snippet.get("description", ""),
-                "publishedAt": snippet.get("publishedAt", ""),
-                "channelTitle": snippet.get("channelTitle", ""),
-                "duration": content_details.get("duration", ""),
-                "viewCount": statistics.get("viewCount", "0"),
-                "likeCount": statistics.get("likeCount", "0"),
-            }
+    batches = [
+        video_ids[i : i + batch_size] for i in range(0, len(video_ids), batch_size)
+    ]
+    base_params = {"part": "snippet,contentDetails,statistics", "key": api_key}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # map() yields results in batch order, which keeps video order intact
+        for batch_metadata in executor.map(
+            lambda batch: _fetch_metadata_batch(batch, base_params, api_delay),
+            batches,
+        ):
+            metadata.update(batch_metadata)
 
     return metadata
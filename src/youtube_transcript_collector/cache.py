@@ -0,0 +1,222 @@
+"""On-disk caching of downloaded transcripts and channel lookups."""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Root directory for all cached data
+CACHE_DIR = Path.home() / ".cache" / "ytc"
+TRANSCRIPT_CACHE_DIR = CACHE_DIR / "transcripts"
+CHANNEL_CACHE_PATH = CACHE_DIR / "channels.json"
+
+# Channel IDs and uploads playlists practically never change
+CHANNEL_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Number of transcripts kept in memory for the current process
+MEMORY_CACHE_SIZE = 256
+
+_memory_cache: "OrderedDict[str, str]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+# Contents of channels.json, loaded on first use
+_channel_cache: Optional[Dict[str, Dict]] = None
+_channel_lock = threading.Lock()
+
+
+def transcript_cache_enabled() -> bool:
+    """Return False if the cache is disabled with YTC_NO_TRANSCRIPT_CACHE=1."""
+    return os.getenv("YTC_NO_TRANSCRIPT_CACHE") != "1"
+
+
+def transcript_cache_key(video_id: str, languages: Optional[List[str]] = None) -> str:
+    """
+    Build the cache key for a transcript request.
+
+    Args:
+        video_id: The YouTube video ID
+        languages: Optional list of language codes, in order of preference
+
+    Returns:
+        Hex-encoded SHA-256 digest of the video ID and languages
+    """
+    raw = video_id + "|" + ",".join(languages or [])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _transcript_cache_path(key: str) -> Path:
+    return TRANSCRIPT_CACHE_DIR / key[:2] / f"{key}.json"
+
+
+def _remember(key: str, text: str) -> None:
+    with _memory_lock:
+        _memory_cache[key] = text
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def load_cached_transcript(key: str) -> Optional[str]:
+    """
+    Load a cached transcript.
+
+    Args:
+        key: Cache key from transcript_cache_key()
+
+    Returns:
+        The cached transcript text, or None if it is missing or unreadable
+    """
+    with _memory_lock:
+        text = _memory_cache.get(key)
+        if text is not None:
+            _memory_cache.move_to_end(key)
+            return text
+
+    try:
+        with open(_transcript_cache_path(key), encoding="utf-8") as f:
+            text = json.load(f)["text"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    if not isinstance(text, str):
+        return None
+
+    _remember(key, text)
+    return text
+
+
+def store_cached_transcript(key: str, text: str) -> None:
+    """
+    Store a transcript in the cache. Write errors are ignored.
+
+    Args:
+        key: Cache key from transcript_cache_key()
+        text: The transcript text
+    """
+    _remember(key, text)
+
+    path = _transcript_cache_path(key)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    # Encode once up front; json.dump() to a text file writes many small chunks
+    payload = json.dumps(
+        {"text": text, "fetched_at": datetime.now(timezone.utc).isoformat()}
+    ).encode("utf-8")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(payload)
+        # Atomic rename so concurrent readers never see a partial file
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def channel_cache_enabled() -> bool:
+    """Return False if the cache is disabled with YTC_NO_CHANNEL_CACHE=1."""
+    return os.getenv("YTC_NO_CHANNEL_CACHE") != "1"
+
+
+def _load_channel_cache() -> Dict[str, Dict]:
+    """
+    Return cached channel lookups, reading channels.json on first use.
+
+    The caller must hold _channel_lock.
+    """
+    global _channel_cache
+    if _channel_cache is None:
+        try:
+            with open(CHANNEL_CACHE_PATH, encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = {}
+        _channel_cache = entries if isinstance(entries, dict) else {}
+    return _channel_cache
+
+
+def load_cached_channel_value(key: str) -> Optional[str]:
+    """
+    Load a cached channel lookup result.
+
+    Args:
+        key: Cache key of the lookup
+
+    Returns:
+        The cached value, or None if it is missing, expired or unreadable
+    """
+    with _channel_lock:
+        entry = _load_channel_cache().get(key)
+
+    try:
+        value, cached_at = entry["value"], float(entry["cached_at"])
+    except (TypeError, KeyError, ValueError):
+        return None
+
+    if not isinstance(value, str) or time.time() - cached_at > CHANNEL_CACHE_TTL:
+        return None
+    return value
+
+
+def store_cached_channel_value(key: str, value: str) -> None:
+    """
+    Store a channel lookup result. Write errors are ignored.
+
+    Args:
+        key: Cache key of the lookup
+        value: The lookup result
+    """
+    with _channel_lock:
+        entries = _load_channel_cache()
+        entries[key] = {"value": value, "cached_at": time.time()}
+
+        tmp_path = CHANNEL_CACHE_PATH.with_name(
+            f"{CHANNEL_CACHE_PATH.name}.{os.getpid()}.tmp"
+        )
+        try:
+            CHANNEL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, CHANNEL_CACHE_PATH)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+
+def cache_channel_lookup(func: Callable[..., str]) -> Callable[..., str]:
+    """
+    Cache a channel lookup in ~/.cache/ytc/channels.json.
+
+    Results are keyed by the function name and its first argument (the channel
+    identifier), so the API key and delays don't affect caching. Exceptions and
+    results equal to the identifier (e.g. a channel ID passed through as-is) are
+    not cached. Set YTC_NO_CHANNEL_CACHE=1 to bypass the cache.
+    """
+    signature = inspect.signature(func)
+    key_param = next(iter(signature.parameters))
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> str:
+        if not channel_cache_enabled():
+            return func(*args, **kwargs)
+
+        # Bind like a real call, so the identifier may also be passed by keyword
+        identifier = signature.bind(*args, **kwargs).arguments[key_param]
+        key = f"{func.__name__}:{identifier}"
+        value = load_cached_channel_value(key)
+        if value is None:
+            value = func(*args, **kwargs)
+            if value != identifier:
+                store_cached_channel_value(key, value)
+        return value
+
+    return wrapper
@@ -0,0 +1,145 @@
+"""Append-only JSONL storage for transcripts."""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+TRANSCRIPTS_FILENAME = "transcripts.jsonl"
+INDEX_FILENAME = "index.json"
+
+
+def _dumps(record: Dict) -> bytes:
+    """Serialize a record to a single line of JSON."""
+    if orjson is not None:
+        return orjson.dumps(record)
+    return json.dumps(record, ensure_ascii=False).encode("utf-8")
+
+
+def _video_title(video_id: str, metadata: Optional[Dict] = None) -> str:
+    """Return the video's title from its metadata, falling back to the video ID."""
+    return metadata.get("title", video_id) if metadata else video_id
+
+
+class JsonlTranscriptWriter:
+    """
+    Appends transcripts as lines of a single transcripts.jsonl file.
+
+    An index.json sidecar maps each video ID to the byte offset of its line,
+    so single transcripts can be read without scanning the whole file. Lines
+    appended after the index was last written (e.g. by an interrupted run)
+    are recovered when the writer is created. A partially written last line
+    is left in place and terminated before the next append, so existing data
+    is never truncated.
+
+    The writer is not thread-safe; use it from a single thread.
+    """
+
+    def __init__(self, output_dir: Path):
+        """
+        Args:
+            output_dir: Directory containing transcripts.jsonl and index.json
+        """
+        self.path = output_dir / TRANSCRIPTS_FILENAME
+        self.index_path = output_dir / INDEX_FILENAME
+        self.offsets: Dict[str, int] = {}
+        self._file = None
+        # Set when the file ends in a partial line that needs terminating
+        self._partial_tail = False
+        self._load_index()
+
+    def _load_index(self) -> None:
+        try:
+            file_size = self.path.stat().st_size
+        except FileNotFoundError:
+            return
+
+        # Checked directly rather than during recovery, since an up-to-date
+        # index can still cover a file that ends in an interrupted write
+        if file_size:
+            with open(self.path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                self._partial_tail = f.read(1) != b"\n"
+
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+            offsets, indexed_size = dict(index["offsets"]), int(index["size"])
+        except (OSError, ValueError, KeyError, TypeError):
+            offsets, indexed_size = {}, 0
+
+        # The data file is shorter than the index says, so the index is stale
+        if indexed_size > file_size:
+            offsets, indexed_size = {}, 0
+
+        self.offsets = offsets
+        if indexed_size < file_size:
+            self._recover(indexed_size)
+
+    def _recover(self, start: int) -> None:
+        """Index complete lines from byte `start` onwards."""
+        offset = start
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Interrupted write; it stays unindexed
+                    break
+                try:
+                    self.offsets[json.loads(line)["video_id"]] = offset
+                except (ValueError, KeyError, TypeError):
+                    pass
+                offset += len(line)
+
+    def write(
+        self, video_id: str, transcript_text: str, metadata: Optional[Dict] = None
+    ) -> None:
+        """
+        Append a transcript.
+
+        Args:
+            video_id: The YouTube video ID
+            transcript_text: The transcript text to save
+            metadata: Optional dictionary with video metadata (title, description, etc.)
+        """
+        if self._file is None:
+            self._file = open(self.path, "ab")
+            if self._partial_tail:
+                self._file.write(b"\n")
+                self._partial_tail = False
+
+        record = {
+            "video_id": video_id,
+            "title": _video_title(video_id, metadata),
+            "metadata": metadata or {},
+            "text": transcript_text,
+        }
+        offset = self._file.tell()
+        self._file.write(_dumps(record) + b"\n")
+        self.offsets[video_id] = offset
+
+    def close(self) -> None:
+        """Close the data file and write the index."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        if not self.path.exists():
+            return
+
+        index = {"size": self.path.stat().st_size, "offsets": self.offsets}
+        tmp_path = self.index_path.with_name(f"{INDEX_FILENAME}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, self.index_path)
+
+    def __enter__(self) -> "JsonlTranscriptWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
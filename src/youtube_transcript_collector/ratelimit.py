@@ -0,0 +1,105 @@
+"""Rate limiting for HTTP requests based on server response headers."""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import requests
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date) into a delay in seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_rate_limit_reset(value: Optional[str]) -> Optional[float]:
+    """Parse an X-RateLimit-Reset header (epoch or seconds) into a delay in seconds."""
+    if not value:
+        return None
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    # Large values are epoch timestamps, small ones are relative delays
+    if reset > 1e9:
+        reset -= time.time()
+    return max(0.0, reset)
+
+
+class HeaderRateLimiter:
+    """
+    Per-host request pacing driven by rate-limit response headers.
+
+    Instead of sleeping a fixed amount after every request, callers wait only
+    when the server asked them to: via `Retry-After`, an exhausted
+    `X-RateLimit-Remaining`, or exponential backoff after 429/503 responses.
+    The limiter is shared across threads.
+    """
+
+    def __init__(self, backoff_factor: float = 2.0, max_backoff: float = 60.0):
+        """
+        Args:
+            backoff_factor: Base of the exponential backoff after 429/503 responses
+                            without a Retry-After header (default: 2.0)
+            max_backoff: Maximum backoff delay in seconds (default: 60.0)
+        """
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self._next_allowed: Dict[str, float] = {}
+        self._failures: Dict[str, int] = {}
+
+    def acquire(self, host: str, min_interval: float = 0.0) -> None:
+        """
+        Block until a request to `host` is allowed.
+
+        Args:
+            host: Host the request is sent to
+            min_interval: Minimum delay in seconds between requests to this host
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_allowed.get(host, now))
+            # Reserve this slot so concurrent callers queue up behind it
+            self._next_allowed[host] = start + min_interval
+
+        if start > now:
+            time.sleep(start - now)
+
+    def update(self, host: str, response: requests.Response) -> None:
+        """
+        Schedule the next allowed request to `host` from a response's headers.
+
+        Args:
+            host: Host the request was sent to
+            response: The response received from the host
+        """
+        headers = response.headers
+        delay = None
+
+        with self._lock:
+            if response.status_code in (429, 503):
+                failures = self._failures.get(host, 0) + 1
+                self._failures[host] = failures
+                delay = _parse_retry_after(headers.get("Retry-After"))
+                if delay is None:
+                    delay = min(self.max_backoff, self.backoff_factor**failures)
+            else:
+                self._failures.pop(host, None)
+                if headers.get("X-RateLimit-Remaining", "").strip() == "0":
+                    delay = _parse_rate_limit_reset(headers.get("X-RateLimit-Reset"))
+
+            if delay:
+                next_allowed = time.monotonic() + delay
+                if next_allowed > self._next_allowed.get(host, 0.0):
+                    self._next_allowed[host] = next_allowed
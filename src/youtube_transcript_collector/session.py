@@ -0,0 +1,39 @@
+"""Shared HTTP session setup."""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session(
+    pool_connections: int = 1, pool_maxsize: int = 10
+) -> requests.Session:
+    """
+    Create a requests session with keep-alive connection pooling and retries.
+
+    Requests that fail with 429 or 5xx responses are retried with backoff,
+    honoring Retry-After. The last response is returned rather than raised, so
+    callers can inspect its status and headers.
+
+    Args:
+        pool_connections: Number of hosts to keep connection pools for (default: 1)
+        pool_maxsize: Maximum number of connections kept per host (default: 10)
+
+    Returns:
+        The configured session
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False,
+            ),
+        ),
+    )
+    return session
@@ -1,8 +1,14 @@
 """Functions for downloading and saving YouTube transcripts."""
 
-import time
+import asyncio
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from rich.console import Console
 from rich.progress import (
@@ -17,9 +23,48 @@ from rich.table import Table
 from youtube_transcript_api import YouTubeTranscriptApi
 
 from .api import get_all_video_ids, get_video_metadata
+from .cache import (
+    load_cached_transcript,
+    store_cached_transcript,
+    transcript_cache_enabled,
+    transcript_cache_key,
+)
+from .jsonl import JsonlTranscriptWriter, _video_title
+from .ratelimit import HeaderRateLimiter
+from .session import create_session
 
 console = Console()
 
+# Paces transcript downloads across all download threads
+_TRANSCRIPT_LIMITER = HeaderRateLimiter()
+_TRANSCRIPT_HOST = "www.youtube.com"
+
+# Metadata keys shown in the markdown header, in order, with their labels
+_MARKDOWN_FIELDS = (
+    ("channelTitle", "Channel"),
+    ("publishedAt", "Published"),
+    ("duration", "Duration"),
+    ("viewCount", "Views"),
+)
+
+# Sidecar file in the output directory used for incremental runs
+STATE_FILENAME = ".ytc_state.json"
+
+# Transcript API clients are reused across videos. Each client wraps a
+# requests.Session, which isn't thread-safe, so every download thread gets
+# its own client backed by a pooled session that retries 429/5xx responses.
+_thread_local = threading.local()
+
+
+def _get_ytt_api() -> YouTubeTranscriptApi:
+    """Return the transcript API client for the current thread."""
+    ytt_api = getattr(_thread_local, "ytt_api", None)
+    if ytt_api is None:
+        ytt_api = _thread_local.ytt_api = YouTubeTranscriptApi(
+            http_client=create_session()
+        )
+    return ytt_api
+
 
 def download_transcript(
     video_id: str, languages: Optional[List[str]] = None
@@ -36,7 +81,7 @@ def download_transcript(
         Transcript text as a string, or None if no transcript is available
     """
     try:
-        ytt_api = YouTubeTranscriptApi()
+        ytt_api = _get_ytt_api()
 
         if languages:
             transcript = ytt_api.fetch(video_id, languages=languages)
@@ -44,8 +89,7 @@ def download_transcript(
             transcript = ytt_api.fetch(video_id)
 
         # Combine all transcript entries into a single text
-        transcript_text = "\n".join([entry.text for entry in transcript])
-        return transcript_text
+        return "\n".join(map(attrgetter("text"), transcript))
     except Exception as e:
         console.print(
             f"[red]Error downloading transcript for video {video_id}: {e}[/red]"
@@ -53,6 +97,78 @@ def download_transcript(
         return None
 
 
+def cached_download_transcript(
+    video_id: str, languages: Optional[List[str]] = None, delay: float = 0.0
+) -> Optional[str]:
+    """
+    Download transcript for a given video ID, using the on-disk transcript cache.
+
+    Transcripts are cached under ~/.cache/ytc/transcripts, keyed by video ID and
+    languages. Set YTC_NO_TRANSCRIPT_CACHE=1 to bypass the cache.
+
+    Args:
+        video_id: The YouTube video ID
+        languages: Optional list of language codes to try (e.g., ['en', 'es']).
+                   If None, tries to fetch any available transcript.
+        delay: Minimum delay in seconds between the start of transcript downloads,
+               shared by all threads (default: 0.0). Cache hits are not delayed.
+
+    Returns:
+        Transcript text as a string, or None if no transcript is available
+    """
+    key = None
+    if transcript_cache_enabled():
+        key = transcript_cache_key(video_id, languages)
+        transcript_text = load_cached_transcript(key)
+        if transcript_text is not None:
+            return transcript_text
+
+    _TRANSCRIPT_LIMITER.acquire(_TRANSCRIPT_HOST, delay)
+    transcript_text = download_transcript(video_id, languages=languages)
+    if key and transcript_text:
+        store_cached_transcript(key, transcript_text)
+    return transcript_text
+
+
+def _render_markdown(
+    video_id: str, transcript_text: str, metadata: Optional[Dict] = None
+) -> str:
+    """Render a transcript and its metadata as a markdown document."""
+    parts = [
+        f"# {_video_title(video_id, metadata)}\n\n",
+        f"**Video ID:** {video_id}\n\n",
+        f"**Video URL:** https://www.youtube.com/watch?v={video_id}\n\n",
+    ]
+
+    if metadata:
+        for key, label in _MARKDOWN_FIELDS:
+            value = metadata.get(key)
+            if value:
+                parts.append(f"**{label}:** {value}\n\n")
+
+        description = metadata.get("description")
+        if description:
+            parts.append(f"## Description\n\n{description}\n\n")
+
+    parts.append("---\n\n## Transcript\n\n")
+    parts.append(transcript_text)
+
+    return "".join(parts)
+
+
+def _write_markdown(
+    file_path: Path,
+    video_id: str,
+    transcript_text: str,
+    metadata: Optional[Dict] = None,
+) -> None:
+    """Write a transcript's markdown document to an existing directory."""
+    # Render the whole document first so it's encoded and written in one go
+    file_path.write_bytes(
+        _render_markdown(video_id, transcript_text, metadata).encode("utf-8")
+    )
+
+
 def save_transcript(
     video_id: str,
     transcript_text: str,
@@ -75,35 +191,37 @@ def save_transcript(
     output_path.mkdir(exist_ok=True)
 
     file_path = output_path / f"{video_id}.md"
-
-    with open(file_path, "w", encoding="utf-8") as f:
-        # Use title from metadata if available, otherwise use video_id
-        title = metadata.get("title", video_id) if metadata else video_id
-
-        f.write(f"# {title}\n\n")
-        f.write(f"**Video ID:** {video_id}\n\n")
-        f.write(f"**Video URL:** https://www.youtube.com/watch?v={video_id}\n\n")
-
-        if metadata:
-            if metadata.get("channelTitle"):
-                f.write(f"**Channel:** {metadata['channelTitle']}\n\n")
-            if metadata.get("publishedAt"):
-                f.write(f"**Published:** {metadata['publishedAt']}\n\n")
-            if metadata.get("duration"):
-                f.write(f"**Duration:** {metadata['duration']}\n\n")
-            if metadata.get("viewCount"):
-                f.write(f"**Views:** {metadata['viewCount']}\n\n")
-            if metadata.get("description"):
-                f.write("## Description\n\n")
-                f.write(f"{metadata['description']}\n\n")
-
-        f.write("---\n\n")
-        f.write("## Transcript\n\n")
-        f.write(transcript_text)
+    _write_markdown(file_path, video_id, transcript_text, metadata)
 
     return file_path
 
 
+def _existing_video_ids(output_path: Path) -> Set[str]:
+    """Return IDs of videos with a saved transcript, using a single directory scan."""
+    with os.scandir(output_path) as entries:
+        return {
+            entry.name[:-3]
+            for entry in entries
+            if entry.name.endswith(".md") and entry.is_file()
+        }
+
+
+def _load_latest_video_id(output_path: Path) -> Optional[str]:
+    """Return the newest video ID recorded by a previous incremental run, if any."""
+    try:
+        with open(output_path / STATE_FILENAME, encoding="utf-8") as f:
+            latest_video_id = json.load(f).get("latest_video_id")
+    except (OSError, ValueError, AttributeError):
+        return None
+    return latest_video_id if isinstance(latest_video_id, str) else None
+
+
+def _save_latest_video_id(output_path: Path, video_id: str) -> None:
+    """Record the newest video ID seen so the next incremental run can stop there."""
+    with open(output_path / STATE_FILENAME, "w", encoding="utf-8") as f:
+        json.dump({"latest_video_id": video_id}, f)
+
+
 def download_channel_transcripts(
     channel_id: str,
     api_key: str,
@@ -111,8 +229,11 @@ def download_channel_transcripts(
     max_videos: Optional[int] = None,
     languages: Optional[List[str]] = None,
     skip_existing: bool = True,
-    api_delay: float = 1.0,
+    api_delay: float = 0.0,
     transcript_delay: float = 0.5,
+    max_workers: int = 8,
+    incremental: bool = False,
+    output_format: str = "markdown",
 ) -> dict:
     """
     Download transcripts for all videos from a channel.
@@ -124,8 +245,17 @@ def download_channel_transcripts(
         max_videos: Optional maximum number of videos to process
         languages: Optional list of language codes to try for transcripts
         skip_existing: If True, skip videos that already have transcripts saved
-        api_delay: Delay in seconds between YouTube Data API requests (default: 1.0)
-        transcript_delay: Delay in seconds between transcript downloads (default: 0.5)
+        api_delay: Minimum delay in seconds between YouTube Data API requests
+                   (default: 0.0)
+        transcript_delay: Minimum delay in seconds between the start of transcript
+                          downloads, shared by all workers (default: 0.5)
+        max_workers: Maximum number of transcripts downloaded concurrently (default: 8)
+        incremental: If True, only list videos newer than the newest video seen by
+                     the previous incremental run into output_dir. Videos that failed
+                     in earlier runs are not retried.
+        output_format: "markdown" to save one .md file per video (default), or
+                       "jsonl" to append all transcripts to a single
+                       transcripts.jsonl file with an index.json of byte offsets
 
     Returns:
         Dictionary with statistics about the download process:
@@ -134,7 +264,15 @@ def download_channel_transcripts(
         - skipped: Number of videos skipped (already exists)
         - failed: Number of failed downloads
         - failed_videos: List of video IDs that failed to download
+
+    Raises:
+        ValueError: If output_format is not "markdown" or "jsonl"
     """
+    if output_format not in ("markdown", "jsonl"):
+        raise ValueError(
+            f"Unknown output format: {output_format}. Use 'markdown' or 'jsonl'."
+        )
+
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
 
@@ -142,22 +280,44 @@ def download_channel_transcripts(
     console.print(
         f"[cyan]🔍 Fetching video IDs for channel [bold]{channel_id}[/bold]...[/cyan]"
     )
+    latest_video_id = _load_latest_video_id(output_path) if incremental else None
     video_ids = get_all_video_ids(
-        channel_id, api_key, max_results=max_videos, api_delay=api_delay
+        channel_id,
+        api_key,
+        max_results=max_videos,
+        api_delay=api_delay,
+        stop_at=latest_video_id,
     )
-    console.print(f"[green]✓ Found [bold]{len(video_ids)}[/bold] videos[/green]\n")
+    if latest_video_id:
+        console.print(
+            f"[green]✓ Found [bold]{len(video_ids)}[/bold] new videos[/green]\n"
+        )
+    else:
+        console.print(f"[green]✓ Found [bold]{len(video_ids)}[/bold] videos[/green]\n")
 
-    # Fetch video metadata
-    console.print("[cyan]📋 Fetching video metadata...[/cyan]")
-    video_metadata = get_video_metadata(video_ids, api_key, api_delay=api_delay)
-    console.print(
-        f"[green]✓ Retrieved metadata for [bold]{len(video_metadata)}[/bold] videos[/green]\n"
+    jsonl_writer = (
+        JsonlTranscriptWriter(output_path) if output_format == "jsonl" else None
     )
 
+    if not skip_existing:
+        existing_video_ids = set()
+    elif jsonl_writer:
+        existing_video_ids = set(jsonl_writer.offsets)
+    else:
+        # Scan the output directory once instead of checking each file
+        existing_video_ids = _existing_video_ids(output_path)
+
+    # Only videos without a saved transcript are downloaded or need metadata
+    videos_to_fetch = [v for v in video_ids if v not in existing_video_ids]
+    if len(videos_to_fetch) < len(video_ids):
+        console.print(
+            f"[yellow]⏭  Skipping [bold]{len(video_ids) - len(videos_to_fetch)}[/bold] videos (already exist)[/yellow]\n"
+        )
+
     stats = {
         "total_videos": len(video_ids),
         "downloaded": 0,
-        "skipped": 0,
+        "skipped": len(video_ids) - len(videos_to_fetch),
         "failed": 0,
         "failed_videos": [],
     }
@@ -171,53 +331,84 @@ def download_channel_transcripts(
         TimeElapsedColumn(),
         TimeRemainingColumn(),
         console=console,
+        # Workers finish in bursts; a low refresh rate keeps rendering cheap
+        refresh_per_second=4,
     ) as progress:
         task = progress.add_task(
-            "[cyan]Downloading transcripts...", total=len(video_ids)
+            "[cyan]Downloading transcripts...", total=len(videos_to_fetch)
         )
 
-        for video_id in video_ids:
-            file_path = output_path / f"{video_id}.md"
-            metadata = video_metadata.get(video_id, {})
-            video_title = metadata.get("title", video_id) if metadata else video_id
-
-            # Skip if file already exists
-            if skip_existing and file_path.exists():
-                progress.update(
-                    task,
-                    description=f"[yellow]⏭  Skipping [bold]{video_title[:50]}[/bold]... (already exists)[/yellow]",
-                )
-                stats["skipped"] += 1
-                progress.advance(task)
-                continue
+        # Downloads are I/O-bound, so run them on a bounded pool of threads.
+        # Results are saved from this thread as they complete, which also
+        # makes it the only writer of the JSONL file.
+        with ExitStack() as stack:
+            executor = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers))
+            # If the loop exits early (e.g. Ctrl-C), drop queued downloads
+            # instead of waiting for the rest of the channel to finish
+            stack.callback(executor.shutdown, wait=False, cancel_futures=True)
+            if jsonl_writer:
+                stack.enter_context(jsonl_writer)
+
+            # Metadata is only needed for saving, so fetch it in the background
+            # while the first transcripts are already downloading
+            console.print("[cyan]📋 Fetching video metadata...[/cyan]")
+            metadata_executor = stack.enter_context(ThreadPoolExecutor(max_workers=1))
+            metadata_future = metadata_executor.submit(
+                get_video_metadata, videos_to_fetch, api_key, api_delay=api_delay
+            )
 
-            progress.update(
-                task,
-                description=f"[cyan]📥 Downloading transcript for [bold]{video_title[:50]}[/bold]...[/cyan]",
+            futures = {
+                executor.submit(
+                    cached_download_transcript, video_id, languages, transcript_delay
+                ): video_id
+                for video_id in videos_to_fetch
+            }
+
+            video_metadata = metadata_future.result()
+            console.print(
+                f"[green]✓ Retrieved metadata for [bold]{len(video_metadata)}[/bold] videos[/green]\n"
             )
-            transcript_text = download_transcript(video_id, languages=languages)
-
-            # Add delay after transcript download to avoid rate limiting
-            time.sleep(transcript_delay)
-
-            if transcript_text:
-                save_transcript(
-                    video_id, transcript_text, output_dir, metadata=metadata
-                )
-                stats["downloaded"] += 1
-                progress.update(
-                    task,
-                    description=f"[green]✓ Saved transcript for [bold]{video_title[:50]}[/bold][/green]",
-                )
-            else:
-                stats["failed"] += 1
-                stats["failed_videos"].append(video_id)
-                progress.update(
-                    task,
-                    description=f"[red]✗ Failed to download transcript for [bold]{video_title[:50]}[/bold][/red]",
-                )
-
-            progress.advance(task)
+
+            for future in as_completed(futures):
+                video_id = futures[future]
+                metadata = video_metadata.get(video_id, {})
+                title = _video_title(video_id, metadata)
+                transcript_text = future.result()
+
+                if transcript_text:
+                    if jsonl_writer:
+                        jsonl_writer.write(video_id, transcript_text, metadata=metadata)
+                    else:
+                        # output_path was created above, so skip save_transcript's mkdir
+                        _write_markdown(
+                            output_path / f"{video_id}.md",
+                            video_id,
+                            transcript_text,
+                            metadata,
+                        )
+                    stats["downloaded"] += 1
+                    progress.update(
+                        task,
+                        description=f"[green]✓ Saved transcript for [bold]{title[:50]}[/bold][/green]",
+                    )
+                else:
+                    stats["failed"] += 1
+                    stats["failed_videos"].append(video_id)
+                    progress.update(
+                        task,
+                        description=f"[red]✗ Failed to download transcript for [bold]{title[:50]}[/bold][/red]",
+                    )
+
+                progress.advance(task)
+
+    # Only advance the marker if the listing wasn't cut short by max_videos,
+    # otherwise the next run would miss the videos in between
+    if (
+        incremental
+        and video_ids
+        and (max_videos is None or len(video_ids) < max_videos)
+    ):
+        _save_latest_video_id(output_path, video_ids[0])
 
     # Print summary
     console.print("\n")
@@ -235,13 +426,33 @@ def download_channel_transcripts(
     console.print(summary_table)
 
     if stats["failed_videos"]:
-        failed_list = []
-        for video_id in stats["failed_videos"]:
-            metadata = video_metadata.get(video_id, {})
-            title = metadata.get("title", video_id) if metadata else video_id
-            failed_list.append(f"{title} ({video_id})")
         console.print("\n[red]Failed videos:[/red]")
-        for item in failed_list:
-            console.print(f"  • {item}")
+        for video_id in stats["failed_videos"]:
+            title = _video_title(video_id, video_metadata.get(video_id))
+            console.print(f"  • {title} ({video_id})")
 
     return stats
+
+
+async def adownload_channel_transcripts(
+    channel_id: str, api_key: str, **kwargs
+) -> dict:
+    """
+    Async version of download_channel_transcripts().
+
+    The download runs in a worker thread, so it doesn't block the event loop.
+    Transcripts are still fetched concurrently by the thread pool inside
+    download_channel_transcripts().
+
+    Args:
+        channel_id: The YouTube channel ID
+        api_key: YouTube Data API v3 key
+        **kwargs: Any other download_channel_transcripts() arguments
+
+    Returns:
+        Dictionary with statistics about the download process, as returned by
+        download_channel_transcripts()
+    """
+    return await asyncio.to_thread(
+        download_channel_transcripts, channel_id, api_key, **kwargs
+    )